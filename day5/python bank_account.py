@@ -3,8 +3,66 @@ Bank Account - Demonstrating Encapsulation and Methods
 A simple banking system using OOP principles.
 """
 
-from datetime import datetime
-from typing import List, Tuple
+import functools
+import sys
+import time
+from collections import deque
+from itertools import islice
+from typing import Deque, Optional, TextIO, Tuple
+
+# Account number layout, e.g. ACC001000
+_ACC_FMT = "ACC{:06d}".format
+
+
+@functools.lru_cache(maxsize=4096)
+def _money(cents: int, signed: bool = False) -> str:
+    """
+    Format an amount in cents as dollars, e.g. $12.50 or $+12.50.
+    
+    Cached, since statements re-render the same balances and amounts.
+    
+    Args:
+        cents (int): Amount to format, in cents
+        signed (bool): Always show the sign (default: False)
+        
+    Returns:
+        str: Formatted amount
+    """
+    return f"${cents / 100:+.2f}" if signed else f"${cents / 100:.2f}"
+
+
+# Statement timestamp layout, plus the last second formatted with it
+_TS_FMT = "%Y-%m-%d %H:%M:%S"
+# (second, formatted) pair, always replaced as a whole so readers never see
+# one thread's second paired with another thread's string
+_last_ts: Tuple[Optional[int], str] = (None, "")
+
+
+def _fmt_ts(timestamp_ns: int) -> str:
+    """
+    Format a nanosecond timestamp as local date and time.
+    
+    Transactions tend to cluster within the same second, so the most
+    recent result is reused until the second changes.
+    
+    Args:
+        timestamp_ns (int): Timestamp from time.time_ns()
+        
+    Returns:
+        str: Local date and time as YYYY-MM-DD HH:MM:SS
+    """
+    global _last_ts
+    sec = timestamp_ns // 1_000_000_000
+    cached_sec, cached_str = _last_ts
+    if sec == cached_sec:
+        return cached_str
+    formatted = time.strftime(_TS_FMT, time.localtime(sec))
+    _last_ts = (sec, formatted)
+    return formatted
+
+
+# Statement row layout: date/time, description, amount, balance
+_STMT_ROW = "{:<20} {:<25} {:>12} {:>12}".format
 
 
 class BankAccount:
@@ -14,20 +72,31 @@ class BankAccount:
     Attributes:
         account_number (str): Unique account identifier
         account_holder (str): Name of the account holder
-        balance (float): Current account balance
-        transaction_history (List[Tuple]): History of all transactions
+        balance (float): Current account balance (stored as integer cents)
+        transaction_history (Deque[Tuple]): Most recent transactions as
+            (timestamp_ns, description, amount_cents, balance_cents)
+        verbose (bool): Whether operations print status messages
     """
     
+    __slots__ = ('account_number', 'account_holder', '_balance_cents',
+                 'transaction_history', '_verbose')
+    
     # Class variable for account number generation
     _next_account_number = 1000
     
-    def __init__(self, account_holder: str, initial_deposit: float = 0.0):
+    # Initial verbose setting for new accounts
+    default_verbose = True
+    
+    def __init__(self, account_holder: str, initial_deposit: float = 0.0,
+                 max_history: Optional[int] = 1024):
         """
         Initialize a new bank account.
         
         Args:
             account_holder (str): Name of the account holder
             initial_deposit (float): Initial deposit amount (default: 0.0)
+            max_history (int, optional): Number of transactions to keep; older
+                ones are dropped (default: 1024, None keeps the full history)
         
         Raises:
             ValueError: If initial deposit is negative
@@ -35,15 +104,18 @@ class BankAccount:
         if initial_deposit < 0:
             raise ValueError("Initial deposit cannot be negative")
         
-        self.account_number = f"ACC{BankAccount._next_account_number:06d}"
-        BankAccount._next_account_number += 1
+        number = BankAccount._next_account_number
+        self.account_number = _ACC_FMT(number)
+        BankAccount._next_account_number = number + 1
         
         self.account_holder = account_holder
-        self._balance = initial_deposit  # Private attribute
-        self.transaction_history: List[Tuple[datetime, str, float, float]] = []
+        # Private attribute; whole cents avoid float rounding drift
+        self._balance_cents = round(initial_deposit * 100)
+        self.transaction_history: Deque[Tuple[int, str, int, int]] = deque(maxlen=max_history)
+        self._verbose = BankAccount.default_verbose
         
-        if initial_deposit > 0:
-            self._add_transaction("Initial Deposit", initial_deposit)
+        if self._balance_cents > 0:
+            self._add_transaction("Initial Deposit", self._balance_cents)
     
     @property
     def balance(self) -> float:
@@ -53,126 +125,176 @@ class BankAccount:
         Returns:
             float: Current balance
         """
-        return self._balance
+        return self._balance_cents / 100
+    
+    @property
+    def verbose(self) -> bool:
+        """
+        Whether deposit/withdraw/transfer print status messages by default.
+        
+        Returns:
+            bool: Current setting for this account
+        """
+        return self._verbose
+    
+    @verbose.setter
+    def verbose(self, value: bool) -> None:
+        """
+        Turn status messages on or off for this account only.
+        
+        Args:
+            value (bool): True to print, False to stay silent
+        """
+        self._verbose = value
     
-    def deposit(self, amount: float) -> bool:
+    def deposit(self, amount: float, *, verbose: Optional[bool] = None) -> bool:
         """
         Deposit money into the account.
         
         Args:
             amount (float): Amount to deposit
+            verbose (bool, optional): Print status messages (default: the
+                account's verbose setting); pass False for bulk loading
             
         Returns:
             bool: True if successful, False otherwise
         """
-        if amount <= 0:
-            print("❌ Deposit amount must be positive")
+        verbose = self.verbose if verbose is None else verbose
+        cents = round(amount * 100)
+        if cents <= 0:
+            if verbose:
+                print("❌ Deposit amount must be positive")
             return False
         
-        self._balance += amount
-        self._add_transaction("Deposit", amount)
-        print(f"✅ Deposited ${amount:.2f}. New balance: ${self._balance:.2f}")
+        self._balance_cents += cents
+        self._add_transaction("Deposit", cents)
+        if verbose:
+            print(f"✅ Deposited {_money(cents)}. New balance: {_money(self._balance_cents)}")
         return True
     
-    def withdraw(self, amount: float) -> bool:
+    def withdraw(self, amount: float, *, verbose: Optional[bool] = None) -> bool:
         """
         Withdraw money from the account.
         
         Args:
             amount (float): Amount to withdraw
+            verbose (bool, optional): Print status messages (default: the
+                account's verbose setting); pass False for bulk loading
             
         Returns:
             bool: True if successful, False otherwise
         """
-        if amount <= 0:
-            print("❌ Withdrawal amount must be positive")
+        verbose = self.verbose if verbose is None else verbose
+        cents = round(amount * 100)
+        if cents <= 0:
+            if verbose:
+                print("❌ Withdrawal amount must be positive")
             return False
         
-        if amount > self._balance:
-            print(f"❌ Insufficient funds. Current balance: ${self._balance:.2f}")
+        if cents > self._balance_cents:
+            if verbose:
+                print(f"❌ Insufficient funds. Current balance: {_money(self._balance_cents)}")
             return False
         
-        self._balance -= amount
-        self._add_transaction("Withdrawal", -amount)
-        print(f"✅ Withdrew ${amount:.2f}. New balance: ${self._balance:.2f}")
+        self._balance_cents -= cents
+        self._add_transaction("Withdrawal", -cents)
+        if verbose:
+            print(f"✅ Withdrew {_money(cents)}. New balance: {_money(self._balance_cents)}")
         return True
     
-    def transfer(self, recipient: 'BankAccount', amount: float) -> bool:
+    def transfer(self, recipient: 'BankAccount', amount: float, *,
+                 verbose: Optional[bool] = None) -> bool:
         """
         Transfer money to another account.
         
         Args:
             recipient (BankAccount): The receiving account
             amount (float): Amount to transfer
+            verbose (bool, optional): Print status messages (default: the
+                account's verbose setting); pass False for bulk loading
             
         Returns:
             bool: True if successful, False otherwise
         """
-        if amount <= 0:
-            print("❌ Transfer amount must be positive")
+        verbose = self.verbose if verbose is None else verbose
+        cents = round(amount * 100)
+        if cents <= 0:
+            if verbose:
+                print("❌ Transfer amount must be positive")
             return False
         
-        if amount > self._balance:
-            print(f"❌ Insufficient funds. Current balance: ${self._balance:.2f}")
+        if cents > self._balance_cents:
+            if verbose:
+                print(f"❌ Insufficient funds. Current balance: {_money(self._balance_cents)}")
             return False
         
-        self._balance -= amount
-        recipient._balance += amount
+        self._balance_cents -= cents
+        recipient._balance_cents += cents
         
-        self._add_transaction(f"Transfer to {recipient.account_number}", -amount)
-        recipient._add_transaction(f"Transfer from {self.account_number}", amount)
+        self._add_transaction(f"Transfer to {recipient.account_number}", -cents)
+        recipient._add_transaction(f"Transfer from {self.account_number}", cents)
         
-        print(f"✅ Transferred ${amount:.2f} to {recipient.account_holder}")
+        if verbose:
+            print(f"✅ Transferred {_money(cents)} to {recipient.account_holder}")
         return True
     
-    def _add_transaction(self, description: str, amount: float) -> None:
+    def _add_transaction(self, description: str, amount_cents: int) -> None:
         """
         Add a transaction to the history (private method).
         
         Args:
             description (str): Transaction description
-            amount (float): Transaction amount
+            amount_cents (int): Transaction amount in cents
         """
-        timestamp = datetime.now()
-        self.transaction_history.append((timestamp, description, amount, self._balance))
+        timestamp = time.time_ns()
+        self.transaction_history.append((timestamp, description, amount_cents, self._balance_cents))
     
-    def get_statement(self, num_transactions: int = 10) -> None:
+    def get_statement(self, num_transactions: int = 10,
+                      file: Optional[TextIO] = None) -> None:
         """
         Print account statement showing recent transactions.
         
+        The statement is built in memory and written in a single call.
+        
         Args:
             num_transactions (int): Number of recent transactions to show
+            file (TextIO, optional): Stream to write to (default: sys.stdout)
         """
-        print(f"\n{'='*70}")
-        print(f"ACCOUNT STATEMENT".center(70))
-        print(f"{'='*70}")
-        print(f"Account Number: {self.account_number}")
-        print(f"Account Holder: {self.account_holder}")
-        print(f"Current Balance: ${self._balance:.2f}")
-        print(f"{'='*70}")
+        parts = [
+            f"\n{'='*70}",
+            f"ACCOUNT STATEMENT".center(70),
+            f"{'='*70}",
+            f"Account Number: {self.account_number}",
+            f"Account Holder: {self.account_holder}",
+            f"Current Balance: {_money(self._balance_cents)}",
+            f"{'='*70}",
+        ]
         
         if not self.transaction_history:
-            print("No transactions yet.")
+            parts.append("No transactions yet.")
         else:
-            print(f"\n{'Date/Time':<20} {'Description':<25} {'Amount':>12} {'Balance':>12}")
-            print("-" * 70)
+            parts.append("\n" + _STMT_ROW('Date/Time', 'Description', 'Amount', 'Balance'))
+            parts.append("-" * 70)
             
-            recent = self.transaction_history[-num_transactions:]
+            # Walk back from the newest entry so cost is O(num_transactions)
+            count = max(num_transactions, 0)
+            recent = list(islice(reversed(self.transaction_history), count))[::-1]
             for timestamp, desc, amount, balance in recent:
-                date_str = timestamp.strftime("%Y-%m-%d %H:%M:%S")
-                amount_str = f"${amount:+.2f}"
-                balance_str = f"${balance:.2f}"
-                print(f"{date_str:<20} {desc:<25} {amount_str:>12} {balance_str:>12}")
+                date_str = _fmt_ts(timestamp)
+                amount_str = _money(amount, True)
+                balance_str = _money(balance)
+                parts.append(_STMT_ROW(date_str, desc, amount_str, balance_str))
         
-        print("=" * 70)
+        parts.append("=" * 70)
+        (file or sys.stdout).write("\n".join(parts) + "\n")
     
     def __str__(self) -> str:
         """String representation of the account."""
-        return f"BankAccount({self.account_number}, {self.account_holder}, ${self._balance:.2f})"
+        return f"BankAccount({self.account_number}, {self.account_holder}, {_money(self._balance_cents)})"
     
     def __repr__(self) -> str:
         """Developer-friendly representation."""
-        return f"BankAccount(account_holder='{self.account_holder}', balance={self._balance})"
+        return f"BankAccount(account_holder='{self.account_holder}', balance={self.balance})"
 
 
 def demo():
@@ -3,7 +3,22 @@ Student Management System - Demonstrating Classes and Methods
 A system to manage student information and grades.
 """
 
-from typing import Dict, List, Optional
+import heapq
+import math
+import sys
+from array import array
+from bisect import bisect_right
+from operator import itemgetter
+from typing import Dict, List, Optional, TextIO
+
+# Letter-grade cutoffs: the number of cutoffs reached indexes _LETTERS
+_CUTS = (60, 70, 80, 90)
+_LETTERS = "FDCBA"
+
+# Report card row layout: subject, grades, average, letter
+_REPORT_ROW = "{:<20} {:<25} {:>10.1f} {:>5}".format
+# Student list row layout: ID, name, age, average, letter
+_LIST_ROW = "{:<10} {:<25} {:>5} {:>10.1f} {:>5}".format
 
 
 class Student:
@@ -14,12 +29,25 @@ class Student:
         student_id (str): Unique student identifier
         name (str): Student's full name
         age (int): Student's age
-        grades (Dict[str, List[float]]): Grades organized by subject
+        grades (Dict[str, array]): Grades organized by subject, stored as
+            packed C doubles
+        verbose (bool): Whether add_grade prints status messages
+        _subject_sum (Dict[str, float]): Running grade total per subject
+        _subject_count (Dict[str, int]): Number of grades per subject
+        _total_sum (float): Running total across all subjects
+        _total_count (int): Number of grades across all subjects
     """
     
+    __slots__ = ('student_id', 'name', 'age', 'grades',
+                 '_subject_sum', '_subject_count', '_total_sum', '_total_count',
+                 '_verbose')
+    
     # Class variable for student ID generation
     _next_id = 1
     
+    # Initial verbose setting for new students
+    default_verbose = True
+    
     def __init__(self, name: str, age: int):
         """
         Initialize a new student.
@@ -39,27 +67,65 @@ class Student:
         
         self.name = name
         self.age = age
-        self.grades: Dict[str, List[float]] = {}
+        self.grades: Dict[str, array] = {}
+        
+        # Running totals so averages don't re-sum every grade list
+        self._subject_sum: Dict[str, float] = {}
+        self._subject_count: Dict[str, int] = {}
+        self._total_sum = 0.0
+        self._total_count = 0
+        self._verbose = Student.default_verbose
+    
+    @property
+    def verbose(self) -> bool:
+        """
+        Whether add_grade prints status messages by default.
+        
+        Returns:
+            bool: Current setting for this student
+        """
+        return self._verbose
     
-    def add_grade(self, subject: str, grade: float) -> None:
+    @verbose.setter
+    def verbose(self, value: bool) -> None:
+        """
+        Turn status messages on or off for this student only.
+        
+        Args:
+            value (bool): True to print, False to stay silent
+        """
+        self._verbose = value
+    
+    def add_grade(self, subject: str, grade: float, *,
+                  verbose: Optional[bool] = None) -> None:
         """
         Add a grade for a specific subject.
         
         Args:
             subject (str): The subject name
             grade (float): The grade (0-100)
+            verbose (bool, optional): Print a status message (default: the
+                student's verbose setting); pass False for bulk loading
             
         Raises:
             ValueError: If grade is not between 0 and 100
         """
+        verbose = self.verbose if verbose is None else verbose
         if not 0 <= grade <= 100:
             raise ValueError("Grade must be between 0 and 100")
         
         if subject not in self.grades:
-            self.grades[subject] = []
+            self.grades[subject] = array('d')
+            self._subject_sum[subject] = 0.0
+            self._subject_count[subject] = 0
         
         self.grades[subject].append(grade)
-        print(f"✅ Added grade {grade:.1f} for {subject}")
+        self._subject_sum[subject] += grade
+        self._subject_count[subject] += 1
+        self._total_sum += grade
+        self._total_count += 1
+        if verbose:
+            print(f"✅ Added grade {grade:.1f} for {subject}")
     
     def get_average(self, subject: Optional[str] = None) -> float:
         """
@@ -73,20 +139,18 @@ class Student:
         """
         if subject:
             # Average for specific subject
-            if subject in self.grades and self.grades[subject]:
-                return sum(self.grades[subject]) / len(self.grades[subject])
+            count = self._subject_count.get(subject, 0)
+            if count:
+                return self._subject_sum[subject] / count
             return 0.0
         else:
             # Overall average across all subjects
-            all_grades = []
-            for subject_grades in self.grades.values():
-                all_grades.extend(subject_grades)
-            
-            if all_grades:
-                return sum(all_grades) / len(all_grades)
+            if self._total_count:
+                return self._total_sum / self._total_count
             return 0.0
     
-    def get_letter_grade(self, average: float) -> str:
+    @staticmethod
+    def get_letter_grade(average: float) -> str:
         """
         Convert numeric grade to letter grade.
         
@@ -96,46 +160,47 @@ class Student:
         Returns:
             str: Letter grade (A, B, C, D, F)
         """
-        if average >= 90:
-            return 'A'
-        elif average >= 80:
-            return 'B'
-        elif average >= 70:
-            return 'C'
-        elif average >= 60:
-            return 'D'
-        else:
-            return 'F'
-    
-    def get_report_card(self) -> None:
-        """Print a detailed report card for the student."""
-        print(f"\n{'='*60}")
-        print(f"REPORT CARD".center(60))
-        print(f"{'='*60}")
-        print(f"Student ID: {self.student_id}")
-        print(f"Name: {self.name}")
-        print(f"Age: {self.age}")
-        print(f"{'='*60}")
+        return _LETTERS[bisect_right(_CUTS, average)]
+    
+    def get_report_card(self, file: Optional[TextIO] = None) -> None:
+        """
+        Print a detailed report card for the student.
+        
+        The report is built in memory and written in a single call.
+        
+        Args:
+            file (TextIO, optional): Stream to write to (default: sys.stdout)
+        """
+        parts = [
+            f"\n{'='*60}",
+            f"REPORT CARD".center(60),
+            f"{'='*60}",
+            f"Student ID: {self.student_id}",
+            f"Name: {self.name}",
+            f"Age: {self.age}",
+            f"{'='*60}",
+        ]
         
         if not self.grades:
-            print("No grades recorded yet.")
+            parts.append("No grades recorded yet.")
         else:
-            print(f"\n{'Subject':<20} {'Grades':<25} {'Average':>10} {'Letter':>5}")
-            print("-" * 60)
+            parts.append(f"\n{'Subject':<20} {'Grades':<25} {'Average':>10} {'Letter':>5}")
+            parts.append("-" * 60)
             
             for subject in sorted(self.grades.keys()):
                 grades_str = ", ".join(f"{g:.1f}" for g in self.grades[subject])
                 avg = self.get_average(subject)
                 letter = self.get_letter_grade(avg)
                 
-                print(f"{subject:<20} {grades_str:<25} {avg:>10.1f} {letter:>5}")
+                parts.append(_REPORT_ROW(subject, grades_str, avg, letter))
             
-            print("-" * 60)
+            parts.append("-" * 60)
             overall_avg = self.get_average()
             overall_letter = self.get_letter_grade(overall_avg)
-            print(f"{'OVERALL':<20} {'':<25} {overall_avg:>10.1f} {overall_letter:>5}")
+            parts.append(_REPORT_ROW('OVERALL', '', overall_avg, overall_letter))
         
-        print("=" * 60)
+        parts.append("=" * 60)
+        (file or sys.stdout).write("\n".join(parts) + "\n")
     
     def get_subjects(self) -> List[str]:
         """
@@ -159,12 +224,21 @@ class Student:
         """
         if subject in self.grades and 0 <= index < len(self.grades[subject]):
             removed = self.grades[subject].pop(index)
+            self._subject_count[subject] -= 1
+            self._total_count -= 1
             print(f"✅ Removed grade {removed:.1f} from {subject}")
             
             # Remove subject if no grades left
             if not self.grades[subject]:
                 del self.grades[subject]
+                del self._subject_sum[subject]
+                del self._subject_count[subject]
+            else:
+                # Re-sum rather than subtract, so rounding error can't build up
+                # (pop() is already O(M) in the subject's grades)
+                self._subject_sum[subject] = math.fsum(self.grades[subject])
             
+            self._total_sum = math.fsum(self._subject_sum.values())
             return True
         
         print(f"❌ Invalid subject or grade index")
@@ -187,6 +261,7 @@ class Classroom:
     Attributes:
         name (str): Classroom name
         students (List[Student]): List of students in the classroom
+        _by_id (Dict[str, Student]): Students keyed by ID for O(1) lookup
     """
     
     def __init__(self, name: str):
@@ -198,35 +273,50 @@ class Classroom:
         """
         self.name = name
         self.students: List[Student] = []
+        self._by_id: Dict[str, Student] = {}  # student_id -> Student
     
-    def add_student(self, student: Student) -> None:
+    def add_student(self, student: Student) -> bool:
         """
         Add a student to the classroom.
         
         Args:
             student (Student): The student to add
+            
+        Returns:
+            bool: True if successful, False if the ID is already enrolled
         """
+        if student.student_id in self._by_id:
+            print(f"❌ Student {student.student_id} is already in {self.name}")
+            return False
+        
         self.students.append(student)
+        self._by_id[student.student_id] = student
         print(f"✅ Added {student.name} to {self.name}")
+        return True
     
     def remove_student(self, student_id: str) -> bool:
         """
         Remove a student by ID.
         
+        Lookup is O(1) through the ID index. Taking the student out of the
+        roster is still O(N): list_students and get_top_students rely on
+        enrollment order, so the remaining students are shifted rather than
+        swapped with the last one.
+        
         Args:
             student_id (str): The student's ID
             
         Returns:
             bool: True if successful, False otherwise
         """
-        for i, student in enumerate(self.students):
-            if student.student_id == student_id:
-                removed = self.students.pop(i)
-                print(f"✅ Removed {removed.name} from {self.name}")
-                return True
+        removed = self._by_id.pop(student_id, None)
+        if removed is None:
+            print(f"❌ Student {student_id} not found")
+            return False
         
-        print(f"❌ Student {student_id} not found")
-        return False
+        self.students.remove(removed)
+        print(f"✅ Removed {removed.name} from {self.name}")
+        return True
     
     def get_student(self, student_id: str) -> Optional[Student]:
         """
@@ -238,10 +328,22 @@ class Classroom:
         Returns:
             Optional[Student]: The student if found, None otherwise
         """
-        for student in self.students:
-            if student.student_id == student_id:
-                return student
-        return None
+        return self._by_id.get(student_id)
+    
+    def _averages(self) -> List[float]:
+        """
+        Get every student's overall average in roster order (private method).
+        
+        Reads the running totals directly in a single pass, so class-wide
+        reports don't pay a get_average() call per student.
+        
+        Returns:
+            List[float]: One average per student, 0.0 for students without grades
+        """
+        return [
+            s._total_sum / s._total_count if s._total_count else 0.0
+            for s in self.students
+        ]
     
     def get_class_average(self) -> float:
         """
@@ -253,8 +355,7 @@ class Classroom:
         if not self.students:
             return 0.0
         
-        total = sum(student.get_average() for student in self.students)
-        return total / len(self.students)
+        return sum(self._averages()) / len(self.students)
     
     def get_top_students(self, n: int = 3) -> List[Student]:
         """
@@ -266,31 +367,40 @@ class Classroom:
         Returns:
             List[Student]: Top students sorted by grade
         """
-        sorted_students = sorted(
-            self.students,
-            key=lambda s: s.get_average(),
-            reverse=True
-        )
-        return sorted_students[:n]
+        # Score each student once, then do a partial selection:
+        # O(N log n) rather than sorting the whole roster
+        scored = list(zip(self._averages(), self.students))
+        return [s for _, s in heapq.nlargest(n, scored, key=itemgetter(0))]
     
-    def list_students(self) -> None:
-        """Print all students in the classroom."""
-        print(f"\n{'='*60}")
-        print(f"{self.name} - Student List".center(60))
-        print(f"{'='*60}")
+    def list_students(self, file: Optional[TextIO] = None) -> None:
+        """
+        Print all students in the classroom.
+        
+        The list is built in memory and written in a single call.
+        
+        Args:
+            file (TextIO, optional): Stream to write to (default: sys.stdout)
+        """
+        parts = [
+            f"\n{'='*60}",
+            f"{self.name} - Student List".center(60),
+            f"{'='*60}",
+        ]
         
         if not self.students:
-            print("No students enrolled.")
+            parts.append("No students enrolled.")
         else:
-            print(f"{'ID':<10} {'Name':<25} {'Age':>5} {'Avg':>10} {'Grade':>5}")
-            print("-" * 60)
+            parts.append(f"{'ID':<10} {'Name':<25} {'Age':>5} {'Avg':>10} {'Grade':>5}")
+            parts.append("-" * 60)
+            
+            averages = self._averages()
+            letters = map(Student.get_letter_grade, averages)
             
-            for student in self.students:
-                avg = student.get_average()
-                letter = student.get_letter_grade(avg)
-                print(f"{student.student_id:<10} {student.name:<25} {student.age:>5} {avg:>10.1f} {letter:>5}")
+            for student, avg, letter in zip(self.students, averages, letters):
+                parts.append(_LIST_ROW(student.student_id, student.name, student.age, avg, letter))
         
-        print("=" * 60)
+        parts.append("=" * 60)
+        (file or sys.stdout).write("\n".join(parts) + "\n")
     
     def __len__(self) -> int:
         """Return the number of students in the classroom."""
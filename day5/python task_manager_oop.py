@@ -3,8 +3,40 @@ Task Manager - Object-Oriented Programming Implementation
 A comprehensive task management system demonstrating OOP principles.
 """
 
+import time
 from datetime import datetime
-from typing import List, Optional
+from typing import List, Optional, Sequence, Tuple
+
+
+def _ns_to_datetime(timestamp_ns: int) -> datetime:
+    """
+    Convert a time.time_ns() timestamp to a local datetime.
+    
+    Splits whole seconds from the remainder with integer math, so the result
+    never rounds up into the next second as float division can.
+    
+    Args:
+        timestamp_ns (int): Nanoseconds since the epoch
+        
+    Returns:
+        datetime: Local date and time, truncated to microseconds
+    """
+    sec, rem = divmod(timestamp_ns, 1_000_000_000)
+    return datetime.fromtimestamp(sec).replace(microsecond=rem // 1000)
+
+
+def _datetime_to_ns(moment: datetime) -> int:
+    """
+    Convert a datetime to nanoseconds since the epoch.
+    
+    Args:
+        moment (datetime): Local (naive) or timezone-aware datetime
+        
+    Returns:
+        int: Nanoseconds since the epoch
+    """
+    sec = int(moment.replace(microsecond=0).timestamp())
+    return sec * 1_000_000_000 + moment.microsecond * 1000
 
 
 class Task:
@@ -18,6 +50,9 @@ class Task:
         completed_at (datetime): Timestamp when task was completed
     """
     
+    __slots__ = ('title', '_is_completed', '_created_ns', '_completed_ns',
+                 '_manager', '_epoch')
+    
     def __init__(self, title: str):
         """
         Initialize a new Task.
@@ -26,20 +61,90 @@ class Task:
             title (str): The task description
         """
         self.title = title
-        self.completed = False
-        self.created_at = datetime.now()
-        self.completed_at: Optional[datetime] = None
+        self._is_completed = False
+        # Raw nanosecond timestamps; datetimes are only built when read
+        self._created_ns = time.time_ns()
+        self._completed_ns: Optional[int] = None
+        # Owning TaskManager, notified when the completion status changes
+        self._manager: Optional['TaskManager'] = None
+        self._epoch = 0
+    
+    @property
+    def created_at(self) -> datetime:
+        """
+        Get the creation time.
+        
+        Returns:
+            datetime: Timestamp when task was created
+        """
+        return _ns_to_datetime(self._created_ns)
+    
+    @created_at.setter
+    def created_at(self, value: datetime) -> None:
+        """
+        Set the creation time.
+        
+        Args:
+            value (datetime): Timestamp when task was created
+        """
+        self._created_ns = _datetime_to_ns(value)
+    
+    @property
+    def completed_at(self) -> Optional[datetime]:
+        """
+        Get the completion time.
+        
+        Returns:
+            Optional[datetime]: Timestamp when task was completed, if any
+        """
+        if self._completed_ns is None:
+            return None
+        return _ns_to_datetime(self._completed_ns)
+    
+    @completed_at.setter
+    def completed_at(self, value: Optional[datetime]) -> None:
+        """
+        Set the completion time.
+        
+        Args:
+            value (Optional[datetime]): Timestamp when task was completed, or None
+        """
+        self._completed_ns = None if value is None else _datetime_to_ns(value)
+    
+    @property
+    def completed(self) -> bool:
+        """
+        Get the completion status.
+        
+        Returns:
+            bool: True if the task is completed
+        """
+        return self._is_completed
+    
+    @completed.setter
+    def completed(self, value: bool) -> None:
+        """
+        Set the completion status, notifying the owning manager on a change.
+        
+        Args:
+            value (bool): New completion status
+        """
+        value = bool(value)
+        if value != self._is_completed:
+            self._is_completed = value
+            if self._manager is not None:
+                self._manager._task_status_changed(self)
     
     def mark_complete(self) -> None:
         """Mark the task as completed and record completion time."""
-        if not self.completed:
+        if not self._is_completed:
+            self._completed_ns = time.time_ns()
             self.completed = True
-            self.completed_at = datetime.now()
     
     def mark_incomplete(self) -> None:
         """Mark the task as incomplete."""
         self.completed = False
-        self.completed_at = None
+        self._completed_ns = None
     
     def __str__(self) -> str:
         """
@@ -68,14 +173,16 @@ class Task:
             str: Detailed task information including timestamps
         """
         status = "Completed" if self.completed else "Pending"
-        details = f"{self}\n"
-        details += f"  Status: {status}\n"
-        details += f"  Created: {self.created_at.strftime('%Y-%m-%d %H:%M:%S')}\n"
+        parts = [
+            str(self),
+            f"  Status: {status}",
+            f"  Created: {self.created_at:%Y-%m-%d %H:%M:%S}",
+        ]
         
-        if self.completed_at:
-            details += f"  Completed: {self.completed_at.strftime('%Y-%m-%d %H:%M:%S')}\n"
+        if self._completed_ns is not None:
+            parts.append(f"  Completed: {self.completed_at:%Y-%m-%d %H:%M:%S}")
         
-        return details
+        return "\n".join(parts) + "\n"
 
 
 class TaskManager:
@@ -84,11 +191,23 @@ class TaskManager:
     
     Attributes:
         tasks (List[Task]): List of all tasks
+        _completed (int): Number of completed tasks, kept up to date by the
+            manager's mutators and by its tasks' status changes
+        _tracked (int): Length of tasks as last seen by the manager; a
+            mismatch means the list was edited directly and triggers a recount
+        _epoch (int): Bumped on every recount; tasks stamped with an older
+            epoch were dropped from the list directly and are ignored
+        _pending_cache (Optional[Tuple[Task, ...]]): Pending tasks from the
+            last list_tasks(False) call, or None after any change
     """
     
     def __init__(self):
         """Initialize an empty task manager."""
         self.tasks: List[Task] = []
+        self._completed = 0
+        self._tracked = 0
+        self._epoch = 0
+        self._pending_cache: Optional[Tuple[Task, ...]] = None
     
     def add_task(self, title: str) -> Task:
         """
@@ -103,24 +222,36 @@ class TaskManager:
         if not title.strip():
             raise ValueError("Task title cannot be empty")
         
+        self._sync_with_tasks()
         task = Task(title.strip())
+        task._manager = self
+        task._epoch = self._epoch
         self.tasks.append(task)
+        self._tracked += 1
+        self._pending_cache = None
         return task
     
-    def list_tasks(self, show_completed: bool = True) -> List[Task]:
+    def list_tasks(self, show_completed: bool = True) -> Sequence[Task]:
         """
         Get all tasks, optionally filtering by completion status.
         
+        Pending tasks are returned as a read-only tuple that is cached until
+        a task is added, removed, or changes status (including assignments
+        to Task.completed, which notify the manager).
+        
         Args:
             show_completed (bool): Whether to include completed tasks
             
         Returns:
-            List[Task]: List of tasks matching the filter
+            Sequence[Task]: Tasks matching the filter
         """
         if show_completed:
             return self.tasks
         else:
-            return [task for task in self.tasks if not task.completed]
+            self._sync_with_tasks()
+            if self._pending_cache is None:
+                self._pending_cache = tuple(task for task in self.tasks if not task.completed)
+            return self._pending_cache
     
     def get_task(self, index: int) -> Optional[Task]:
         """
@@ -146,9 +277,9 @@ class TaskManager:
         Returns:
             bool: True if successful, False otherwise
         """
-        task = self.get_task(index)
-        if task:
-            task.mark_complete()
+        tasks = self.tasks
+        if 0 <= index < len(tasks):
+            tasks[index].mark_complete()
             return True
         return False
     
@@ -162,9 +293,9 @@ class TaskManager:
         Returns:
             bool: True if successful, False otherwise
         """
-        task = self.get_task(index)
-        if task:
-            task.mark_incomplete()
+        tasks = self.tasks
+        if 0 <= index < len(tasks):
+            tasks[index].mark_incomplete()
             return True
         return False
     
@@ -172,14 +303,24 @@ class TaskManager:
         """
         Remove a task by index.
         
+        Tasks are addressed by position, so removal shifts every later task
+        down one index (O(N)); this keeps the remaining tasks in order.
+        
         Args:
             index (int): The task index (0-based)
             
         Returns:
             bool: True if successful, False otherwise
         """
-        if 0 <= index < len(self.tasks):
-            self.tasks.pop(index)
+        self._sync_with_tasks()
+        tasks = self.tasks
+        if 0 <= index < len(tasks):
+            removed = tasks.pop(index)
+            removed._manager = None
+            self._tracked -= 1
+            if removed.completed:
+                self._completed -= 1
+            self._pending_cache = None
             return True
         return False
     
@@ -187,12 +328,63 @@ class TaskManager:
         """
         Remove all completed tasks.
         
+        Pending tasks are compacted to the front of the list in place, so no
+        second list is allocated.
+        
         Returns:
             int: Number of tasks removed
         """
-        initial_count = len(self.tasks)
-        self.tasks = [task for task in self.tasks if not task.completed]
-        return initial_count - len(self.tasks)
+        self._sync_with_tasks()
+        tasks = self.tasks
+        keep = 0
+        for task in tasks:
+            if not task.completed:
+                tasks[keep] = task
+                keep += 1
+            else:
+                task._manager = None
+        
+        removed = len(tasks) - keep
+        del tasks[keep:]
+        self._completed = 0
+        self._tracked = keep
+        self._pending_cache = None
+        return removed
+    
+    def _task_status_changed(self, task: Task) -> None:
+        """
+        Update cached state after a task's status flips (private method).
+        
+        Args:
+            task (Task): The task whose completion status just changed
+        """
+        if len(self.tasks) != self._tracked:
+            # List was edited directly; recount instead of adjusting
+            self._sync_with_tasks()
+            return
+        if task._epoch != self._epoch:
+            # Removed from the list directly before the last recount
+            return
+        self._completed += 1 if task.completed else -1
+        self._pending_cache = None
+    
+    def _sync_with_tasks(self) -> None:
+        """
+        Recount if self.tasks was edited directly (private method).
+        
+        Tasks appended to the list directly are adopted so that their later
+        status changes are tracked too; tasks no longer in the list keep an
+        older epoch and are ignored from then on.
+        """
+        tasks = self.tasks
+        if len(tasks) != self._tracked:
+            self._epoch += 1
+            for task in tasks:
+                task._manager = self
+                task._epoch = self._epoch
+            self._completed = sum(1 for task in tasks if task.completed)
+            self._tracked = len(tasks)
+            self._pending_cache = None
     
     def get_statistics(self) -> dict:
         """
@@ -201,8 +393,9 @@ class TaskManager:
         Returns:
             dict: Statistics including total, completed, and pending tasks
         """
+        self._sync_with_tasks()
         total = len(self.tasks)
-        completed = sum(1 for task in self.tasks if task.completed)
+        completed = self._completed
         pending = total - completed
         
         return {
@@ -239,12 +432,12 @@ def display_menu():
     print("="*50)
 
 
-def display_tasks(tasks: List[Task], title: str = "Tasks"):
+def display_tasks(tasks: Sequence[Task], title: str = "Tasks"):
     """
     Display a list of tasks with indices.
     
     Args:
-        tasks (List[Task]): List of tasks to display
+        tasks (Sequence[Task]): Tasks to display
         title (str): Title for the task list
     """
     print(f"\n{title}:")